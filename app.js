@@ -3097,6 +3097,11 @@ class UI {
 
     // CSV行をパース（ダブルクォートで囲まれた値に対応）
     parseCSVLine(line) {
+        // クォートを含まない行はそのまま分割（1文字ずつの走査を省略）
+        if (!line.includes('"')) {
+            return line.split(',');
+        }
+
         const values = [];
         let current = '';
         let inQuotes = false;